@@ -1,75 +1,342 @@
 import os
 import sys
-import yt_dlp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 import logging
+from logging.handlers import RotatingFileHandler
+import time
 import tempfile
-from PIL import Image
-from io import BytesIO
+import hashlib
+import copy
+import json
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QComboBox, QPushButton, QTextEdit, QFileDialog,
-    QListWidget, QCheckBox, QProgressBar
+    QListWidget, QCheckBox, QProgressBar, QSpinBox
 )
-from PyQt5.QtGui import QPixmap, QImage, QFont
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QFont
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QMutex, QBuffer, QIODevice
 
 # Set up logging to a user-writable temporary directory
 log_dir = tempfile.gettempdir()
 log_file = os.path.join(log_dir, 'video_downloader.log')
-try:
-    logging.basicConfig(filename=log_file, level=logging.DEBUG, 
-                        format='%(asctime)s - %(levelname)s - %(message)s')
-except PermissionError as e:
-    logging.basicConfig(level=logging.DEBUG, 
-                        format='%(asctime)s - %(levelname)s - %(message)s')
-    logging.error(f"Failed to create log file in {log_dir}: {str(e)}")
+log_format = '%(asctime)s - %(levelname)s - %(message)s'
+# Set VD_DEBUG=1 for verbose logs; size-capped rotation keeps long playlist sessions from filling the disk
+log_level = logging.DEBUG if os.environ.get('VD_DEBUG') == '1' else logging.INFO
+# delay=True means the handler won't open the file (or fail) until the first record, so check up front
+if os.access(log_file if os.path.exists(log_file) else log_dir, os.W_OK):
+    log_handler = RotatingFileHandler(log_file, maxBytes=2_000_000, backupCount=2, delay=True)
+    log_handler.setFormatter(logging.Formatter(log_format))
+    logging.getLogger().addHandler(log_handler)
+    logging.getLogger().setLevel(log_level)
+else:
+    logging.basicConfig(level=log_level, format=log_format)
+    logging.error(f"Failed to create log file in {log_dir}: permission denied")
+
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.expanduser("~"), "Downloads", "VideoDownloader")
+
+# On-disk thumbnail cache, keyed by a hash of the thumbnail URL
+thumb_cache_dir = os.path.join(log_dir, 'vdl_thumbs')
+THUMB_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+def prune_thumbnail_cache():
+    try:
+        entries = []
+        with os.scandir(thumb_cache_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        logging.warning(f"Failed to scan thumbnail cache: {str(e)}")
+        return
+    total = sum(size for _, size, _ in entries)
+    # Drop least recently used thumbnails until the cache fits
+    for _, size, path in sorted(entries):
+        if total <= THUMB_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError as e:
+            logging.warning(f"Failed to remove cached thumbnail {path}: {str(e)}")
+
+# On-disk cache of playlist listings so re-previewing a playlist skips yt-dlp entirely
+preview_cache_dir = os.path.join(log_dir, 'vdl_previews')
+PREVIEW_CACHE_TTL = 24 * 60 * 60
+_PLAYLIST_CACHE_KEYS = ('_type', 'id', 'title', 'webpage_url', 'thumbnails', 'thumbnail')
+_ENTRY_CACHE_KEYS = ('_type', 'ie_key', 'id', 'url', 'title', 'duration', 'thumbnails', 'thumbnail')
+
+def preview_cache_path(url):
+    key = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+    return os.path.join(preview_cache_dir, key + '.json')
+
+def load_cached_preview(url):
+    path = preview_cache_path(url)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('url') != url or time.time() - cached.get('cached_at', 0) >= PREVIEW_CACHE_TTL:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+    return cached.get('info')
+
+def prune_preview_cache():
+    # Entries are written once, so a file's mtime is its cache time
+    cutoff = time.time() - PREVIEW_CACHE_TTL
+    try:
+        with os.scandir(preview_cache_dir) as it:
+            expired = [entry.path for entry in it if entry.is_file() and entry.stat().st_mtime < cutoff]
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        logging.warning(f"Failed to scan preview cache: {str(e)}")
+        return
+    for path in expired:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logging.warning(f"Failed to remove cached preview {path}: {str(e)}")
+
+def store_cached_preview(url, info):
+    # Only the fields the preview panel shows are kept; format URLs expire long before the TTL
+    if info.get('_type') != 'playlist' or not isinstance(info.get('entries'), list):
+        return
+    listing = {k: info[k] for k in _PLAYLIST_CACHE_KEYS if k in info}
+    listing['entries'] = [{k: entry[k] for k in _ENTRY_CACHE_KEYS if k in entry}
+                          for entry in info['entries'] if entry]
+    try:
+        os.makedirs(preview_cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=preview_cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'cached_at': time.time(), 'info': listing}, f, default=str)
+        os.replace(tmp_path, preview_cache_path(url))
+    except OSError as e:
+        logging.warning(f"Failed to cache preview for {url}: {str(e)}")
+
+# Compiled once: used on every yt-dlp progress tick
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Error-message keywords, matched case-insensitively against the yt-dlp error in a single pass
+_NOT_FOUND_RE = re.compile(
+    r'video unavailable|not found|content not available|video does not exist|'
+    r'playlist does not exist|removed|private video|unavailable video|not available|'
+    r'sign in|login required',
+    re.IGNORECASE
+)
+_AUTH_RE = re.compile(r'sign in|login required', re.IGNORECASE)
+
+# Case-insensitive checks that the URL's host (not just any part of the text) belongs to the platform
+_PLATFORM_RE = {
+    'YouTube': re.compile(r'^(?:https?://)?(?:[\w-]+\.)*(?:youtube\.com|youtu\.be)(?:[/?#]|$)', re.IGNORECASE),
+    'Facebook': re.compile(r'^(?:https?://)?(?:[\w-]+\.)*(?:facebook\.com|fb\.watch)(?:[/?#]|$)', re.IGNORECASE),
+}
+
+# Preview results kept for reuse by the download step
+INFO_CACHE_SIZE = 64
+
+# Prefer a progressive MP4 that already carries audio and video, so no ffmpeg step is needed
+DOWNLOAD_FORMAT = 'best[ext=mp4][acodec!=none][vcodec!=none]/best'
+
+# Format selection yt-dlp stored on an extracted info dict. process_video_result keeps these
+# when it re-selects, so a stale 'requested_formats' would override the download format.
+_FORMAT_SELECTION_KEYS = (
+    'requested_formats', 'requested_downloads', 'format', 'format_id', 'format_note',
+    'url', 'ext', 'protocol', 'manifest_url', 'fragments', 'fragment_base_url',
+)
+
+# Copy of a preview result with its format choice removed, so the download re-selects with its own options
+def reusable_info(info):
+    info = copy.deepcopy(info)
+    for key in _FORMAT_SELECTION_KEYS:
+        info.pop(key, None)
+    return info
+
+# Number of playlist videos downloaded in parallel
+DEFAULT_DOWNLOAD_WORKERS = 4
+# Number of DASH/HLS fragments fetched in parallel for each video
+DEFAULT_FRAGMENT_WORKERS = 4
+
+PREVIEW_YDL_OPTS = {
+    'extract_flat': 'in_playlist',
+    # Select the same way the download does, so a reused preview result matches
+    'format': DOWNLOAD_FORMAT,
+    'skip_download': True,
+    'quiet': True,
+    'no_warnings': True,
+    # DASH manifests only hold split audio/video streams, which the 'best' download format never picks
+    'extractor_args': {'youtube': {'skip': ['dash', 'translated_subs']}},
+}
+
+# Load a cookies file into an existing YoutubeDL instance so it can be retried in place
+# Raises FileNotFoundError (leaving the instance untouched) if the file is missing.
+# params['cookiefile'] is deliberately left unset: close() would then save the jar back to the file,
+# and parallel download workers would rewrite cookies.txt over each other.
+def use_cookie_file(ydl, cookie_file):
+    ydl.cookiejar.load(cookie_file)
 
 class PreviewThread(QThread):
     info_signal = pyqtSignal(dict)
     error_signal = pyqtSignal(str)
+    # Long-lived extractor shared by previews so its connections and cookie jar are reused.
+    # A YoutubeDL instance is not safe to use from two previews at once.
+    _shared_ydl = None
+    _ydl_lock = QMutex()
 
     def __init__(self, url, platform):
         super().__init__()
         self.url = url
         self.platform = platform
 
+    @classmethod
+    def close_shared_ydl(cls):
+        # Don't block shutdown waiting for a preview that is still running
+        if not cls._ydl_lock.tryLock():
+            return
+        try:
+            if cls._shared_ydl is not None:
+                cls._shared_ydl.close()
+                cls._shared_ydl = None
+        finally:
+            cls._ydl_lock.unlock()
+
     def run(self):
-        ydl_opts = {
-            'extract_flat': True,
-        }
+        cached = load_cached_preview(self.url)
+        if cached is not None:
+            logging.info(f"Using cached preview for {self.url}")
+            self.info_signal.emit(cached)
+            return
+        ydl = None
+        self._ydl_lock.lock()
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.url, download=False)
-                self.info_signal.emit(info)
+            # Imported here rather than at startup: loading yt-dlp's extractors takes a noticeable
+            # moment, and the window doesn't need them until the first preview
+            import yt_dlp
+            if PreviewThread._shared_ydl is None:
+                # YoutubeDL keeps and mutates the params dict it is given, so hand it a copy
+                PreviewThread._shared_ydl = yt_dlp.YoutubeDL(dict(PREVIEW_YDL_OPTS))
+            ydl = PreviewThread._shared_ydl
+            info = ydl.extract_info(self.url, download=False)
+            store_cached_preview(self.url, info)
+            self.info_signal.emit(info)
         except Exception as e:
-            error_str = str(e).lower()
             logging.error(f"Preview error for {self.url}: {str(e)}")
             # Retry with cookies only for YouTube if authentication is required
-            if self.platform == "YouTube" and ("sign in" in error_str or "login required" in error_str) and os.path.exists('cookies.txt'):
-                ydl_opts['cookiefile'] = 'cookies.txt'
+            if ydl is not None and self.platform == "YouTube" and _AUTH_RE.search(str(e)):
                 try:
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        info = ydl.extract_info(self.url, download=False)
-                        self.info_signal.emit(info)
+                    use_cookie_file(ydl, 'cookies.txt')
+                    info = ydl.extract_info(self.url, download=False)
+                    store_cached_preview(self.url, info)
+                    self.info_signal.emit(info)
+                except FileNotFoundError:
+                    # No cookies file to retry with; report the original error
+                    self.error_signal.emit(str(e))
                 except Exception as e2:
                     logging.error(f"Preview error with cookies for {self.url}: {str(e2)}")
                     self.error_signal.emit(str(e2))
             else:
                 self.error_signal.emit(str(e))
+        finally:
+            self._ydl_lock.unlock()
+
+class ThumbnailThread(QThread):
+    image_signal = pyqtSignal(QImage)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, url, session):
+        super().__init__()
+        self.url = url
+        self.session = session
+
+    def run(self):
+        try:
+            key = hashlib.blake2b(self.url.encode(), digest_size=8).hexdigest()
+            cache_path = os.path.join(thumb_cache_dir, key + '.jpg')
+            data = None
+            try:
+                with open(cache_path, 'rb') as f:
+                    data = f.read()
+                os.utime(cache_path)  # Mark as recently used for pruning
+            except OSError:
+                pass
+            if data is None:
+                response = self.session.get(self.url, timeout=(2, 5))
+                response.raise_for_status()
+                data = response.content
+                self.store(cache_path, data)
+            qimage = self.decode(data)
+            if qimage.isNull():
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+                raise ValueError("Unsupported or corrupt thumbnail image")
+            self.image_signal.emit(qimage)
+        except Exception as e:
+            logging.error(f"Thumbnail error for URL {self.url}: {str(e)}")
+            self.error_signal.emit(str(e))
+
+    @staticmethod
+    def decode(data):
+        buffer = QBuffer()
+        buffer.setData(data)
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer)
+        size = reader.size()
+        if size.isValid():
+            # Lets the JPEG decoder scale during the IDCT instead of decoding at full size
+            reader.setScaledSize(size.scaled(320, 180, Qt.KeepAspectRatio))
+            return reader.read()
+        qimage = reader.read()
+        if qimage.isNull():
+            return qimage
+        return qimage.scaled(320, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def store(self, cache_path, data):
+        try:
+            os.makedirs(thumb_cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=thumb_cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logging.warning(f"Failed to cache thumbnail {self.url}: {str(e)}")
 
 class DownloadThread(QThread):
-    progress_signal = pyqtSignal(dict)
+    progress_signal = pyqtSignal(str, float, str)  # status, percentage (-1 if unparsable), speed
+    postprocess_signal = pyqtSignal(str)  # name of the ffmpeg post-processing step that started
     error_signal = pyqtSignal(str)
     finished_signal = pyqtSignal()
 
-    def __init__(self, urls, output_path, platform, playlist=False):
+    def __init__(self, urls, output_path, platform, playlist=False, max_workers=DEFAULT_DOWNLOAD_WORKERS,
+                 fragment_workers=DEFAULT_FRAGMENT_WORKERS, infos=None, aria2c_path=None):
         super().__init__()
         self.urls = urls
+        # Fully extracted info dicts from the preview, keyed by URL, so extraction isn't repeated
+        self.infos = infos or {}
         self.output_path = output_path
         self.platform = platform
         self.playlist = playlist
+        self.max_workers = max_workers
+        self.fragment_workers = fragment_workers
+        self.aria2c_path = aria2c_path
+        self._last_emit = 0.0
+        # Per-URL progress: the latest yt-dlp progress dict while downloading, 100.0 once finished
+        self._progress = {}
+        self._progress_lock = threading.Lock()
 
     def run(self):
         ffmpeg_path = os.path.join(os.path.dirname(sys.argv[0]), 'ffmpeg.exe')
@@ -79,38 +346,138 @@ class DownloadThread(QThread):
                 raise FileNotFoundError("ffmpeg.exe is required but not found.")
             logging.info(f"Using ffmpeg from: {ffmpeg_path}")
             ydl_opts = {
-                'outtmpl': os.path.join(self.output_path, '%(title)s.%(ext)s'),
-                'format': 'best',
+                # Parallel playlist downloads need distinct names even when two videos share a title
+                'outtmpl': os.path.join(self.output_path, '%(title)s [%(id)s].%(ext)s' if self.playlist else '%(title)s.%(ext)s'),
+                'format': DOWNLOAD_FORMAT,
                 'merge_output_format': None,
                 'noplaylist': not self.playlist,
-                'progress_hooks': [self.progress_hook],
                 'quiet': False,
                 'noprogress': False,
                 'ffmpeg_location': ffmpeg_path,
+                'concurrent_fragment_downloads': self.fragment_workers,
             }
+            # aria2c splits each file across several HTTP range requests (yt-dlp already passes -x16 -s16).
+            # It only reports completion, so it is opt-in: there is no progress while it runs.
+            if self.aria2c_path:
+                logging.info(f"Using aria2c from: {self.aria2c_path}")
+                ydl_opts['external_downloader'] = {'default': self.aria2c_path}
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download(self.urls)
-            self.finished_signal.emit()
+            errors = []
+            workers = max(1, min(self.max_workers, len(self.urls)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(self.download_one, url, ydl_opts): url for url in self.urls}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logging.error(f"Download error for {futures[future]}: {str(e)}")
+                        errors.append(e)
+            if errors:
+                self.error_signal.emit(str(errors[0]))
+            else:
+                self.finished_signal.emit()
         except Exception as e:
-            error_str = str(e).lower()
             logging.error(f"Download error for {self.urls}: {str(e)}")
-            # Retry with cookies only for YouTube if authentication is required
-            if self.platform == "YouTube" and ("sign in" in error_str or "login required" in error_str) and os.path.exists('cookies.txt'):
-                ydl_opts['cookiefile'] = 'cookies.txt'
+            self.error_signal.emit(str(e))
+
+    def download_one(self, url, ydl_opts):
+        import yt_dlp
+        # Each worker needs its own YoutubeDL: instances are not thread-safe
+        opts = dict(ydl_opts,
+                    progress_hooks=[lambda d: self.progress_hook(url, d)],
+                    postprocessor_hooks=[self.postprocessor_hook])
+        ydl = yt_dlp.YoutubeDL(opts)
+        try:
+            try:
+                self.download_with_info(ydl, url)
+            except Exception as e:
+                # Retry with cookies only for YouTube if authentication is required
+                if self.platform != "YouTube" or not _AUTH_RE.search(str(e)):
+                    raise
+                logging.error(f"Download error for {url}, retrying with cookies: {str(e)}")
                 try:
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        ydl.download(self.urls)
-                    self.finished_signal.emit()
-                except Exception as e2:
-                    logging.error(f"Download error with cookies for {self.urls}: {str(e2)}")
-                    self.error_signal.emit(str(e2))
+                    use_cookie_file(ydl, 'cookies.txt')
+                except FileNotFoundError:
+                    # No cookies file to retry with; report the original error
+                    raise e
+                ydl.download([url])
+        finally:
+            ydl.close()
+
+    def download_with_info(self, ydl, url):
+        info = self.infos.get(url)
+        if info is not None:
+            try:
+                ydl.process_ie_result(reusable_info(info), download=True)
+                return
+            except Exception as e:
+                # Format URLs in the cached info may have expired; fall back to a fresh extraction
+                logging.warning(f"Cached info for {url} could not be used, re-extracting: {str(e)}")
+        ydl.download([url])
+
+    @staticmethod
+    def clean_ansi_codes(text):
+        return _ANSI_RE.sub('', text)
+
+    def parse_progress(self, d):
+        # Strip ANSI codes from both fields in a single regex pass
+        joined = self.clean_ansi_codes(d.get('_percent_str', '0%') + '\x00' + d.get('_speed_str', 'Unknown speed'))
+        percent_str, _, speed = joined.partition('\x00')
+        percent_str = percent_str.replace('%', '').strip()
+        speed = speed.replace('i', 'iB').strip()
+        try:
+            percentage = float(percent_str)
+        except ValueError:
+            percentage = -1.0
+        return percentage, speed
+
+    def overall_progress(self):
+        # Mean across every queued URL (finished ones count as 100%), so the bar never runs backwards
+        if len(self.urls) == 1:
+            d = self._progress.get(self.urls[0])
+            return self.parse_progress(d) if isinstance(d, dict) else (100.0, '')
+        total = 0.0
+        speed_bytes = 0.0
+        for state in self._progress.values():
+            if isinstance(state, dict):
+                percentage, _ = self.parse_progress(state)
+                total += max(percentage, 0.0)
+                speed_bytes += state.get('speed') or 0
             else:
-                self.error_signal.emit(str(e))
+                total += state
+        from yt_dlp.utils import format_bytes
+        return total / len(self.urls), f"{format_bytes(speed_bytes)}/s"
+
+    def postprocessor_hook(self, d):
+        try:
+            name = d.get('postprocessor') or ''
+            # Names come from pp_key(), which drops the FFmpeg prefix (FFmpegMergerPP -> 'Merger').
+            # yt-dlp also runs non-ffmpeg steps such as MoveFiles after every download; don't report those.
+            if d.get('status') == 'started' and (name == 'Merger' or name.startswith('Fixup')):
+                self.postprocess_signal.emit(name)
+        except Exception as e:
+            logging.error(f"Postprocessor hook error: {str(e)}")
 
-    def progress_hook(self, d):
+    def progress_hook(self, url, d):
         try:
-            self.progress_signal.emit(d)
+            status = d.get('status')
+            percentage = 0.0
+            speed = ''
+            with self._progress_lock:
+                if status == 'downloading':
+                    self._progress[url] = d
+                    now = time.monotonic()
+                    total = d.get('total_bytes') or d.get('total_bytes_estimate')
+                    is_last_chunk = bool(total) and d.get('downloaded_bytes') == total
+                    # Don't cross the thread boundary more than ~5 times per second
+                    if not is_last_chunk and now - self._last_emit < 0.2:
+                        return
+                    self._last_emit = now
+                    # Parse here so the GUI thread only receives ready-to-display values
+                    percentage, speed = self.overall_progress()
+                elif status == 'finished':
+                    self._progress[url] = 100.0
+            self.progress_signal.emit(status or '', percentage, speed)
         except Exception as e:
             logging.error(f"Progress hook error: {str(e)}")
 
@@ -118,15 +485,23 @@ class VideoDownloaderApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.video_info = []
+        self.thumbnail_thread = None
+        self.thumbnail_threads = set()
         self.last_percentage = -1  # Track last percentage to filter redundant updates
+        # Shared HTTP session so thumbnail fetches reuse the TLS/keep-alive connection
+        self._http = requests.Session()
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        self._http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+        self._http.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) VideoDownloader'
+        self._info_cache = OrderedDict()  # Preview results by URL, least recently used first
+        # Status lines are buffered and flushed in one append to avoid a QTextEdit relayout per line
+        self._log_buf = []
+        self._log_timer = QTimer()
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+        prune_thumbnail_cache()
+        prune_preview_cache()
         self.initUI()
-        self.loading_states = ["Loading.", "Loading..", "Loading..."]
-        self.loading_index = 0
-        self.loading_timer = QTimer()
-        try:
-            self.loading_timer.timeout.connect(self.update_loading_animation)
-        except Exception as e:
-            logging.error(f"Failed to connect loading timer: {str(e)}")
 
     def initUI(self):
         try:
@@ -162,6 +537,14 @@ class VideoDownloaderApp(QMainWindow):
                     border-radius: 5px;
                     background-color: #ffffff;
                 }
+                QSpinBox {
+                    font-family: 'Segoe UI', Arial, sans-serif;
+                    font-size: 14px;
+                    padding: 6px;
+                    border: 1px solid #dfe6e9;
+                    border-radius: 5px;
+                    background-color: #ffffff;
+                }
                 QPushButton {
                     font-family: 'Segoe UI', Arial, sans-serif;
                     font-size: 14px;
@@ -234,14 +617,13 @@ class VideoDownloaderApp(QMainWindow):
             self.output_label = QLabel("Output Folder:")
             self.output_label.setFont(QFont('Segoe UI', 14, QFont.Bold))
             self.output_input = QLineEdit()
-            default_output = os.path.join(os.path.expanduser("~"), "Downloads", "VideoDownloader")
-            if not os.path.exists(default_output):
-                try:
-                    os.makedirs(default_output)
-                except PermissionError as e:
-                    logging.error(f"Failed to create directory {default_output}: {str(e)}")
-                    default_output = tempfile.gettempdir()
-                    logging.warning(f"Falling back to temp directory: {default_output}")
+            default_output = DEFAULT_OUTPUT_DIR
+            try:
+                os.makedirs(default_output, exist_ok=True)
+            except PermissionError as e:
+                logging.error(f"Failed to create directory {default_output}: {str(e)}")
+                default_output = tempfile.gettempdir()
+                logging.warning(f"Falling back to temp directory: {default_output}")
             self.output_input.setText(default_output)
             self.output_button = QPushButton("Browse")
             self.output_button.clicked.connect(self.browse_folder)
@@ -250,6 +632,29 @@ class VideoDownloaderApp(QMainWindow):
             output_layout.addWidget(self.output_button)
             layout.addLayout(output_layout)
 
+            parallel_layout = QHBoxLayout()
+            self.workers_label = QLabel("Parallel Videos:")
+            self.workers_spin = QSpinBox()
+            self.workers_spin.setRange(1, 16)
+            self.workers_spin.setValue(DEFAULT_DOWNLOAD_WORKERS)
+            self.workers_spin.setToolTip("Number of playlist videos downloaded at the same time")
+            self.fragments_label = QLabel("Fragments per Video:")
+            self.fragments_spin = QSpinBox()
+            self.fragments_spin.setRange(1, 32)
+            self.fragments_spin.setValue(DEFAULT_FRAGMENT_WORKERS)
+            self.fragments_spin.setToolTip("Number of stream fragments fetched at the same time for each video")
+            parallel_layout.addWidget(self.workers_label)
+            parallel_layout.addWidget(self.workers_spin)
+            parallel_layout.addWidget(self.fragments_label)
+            parallel_layout.addWidget(self.fragments_spin)
+            self.aria2c_path = shutil.which('aria2c')
+            self.aria2c_check = QCheckBox("Use aria2c (no progress display)")
+            self.aria2c_check.setToolTip("Faster segmented downloads via aria2c; the progress bar stays empty until each video finishes")
+            self.aria2c_check.setVisible(self.aria2c_path is not None)
+            parallel_layout.addWidget(self.aria2c_check)
+            parallel_layout.addStretch()
+            layout.addLayout(parallel_layout)
+
             self.preview_layout = QVBoxLayout()
             self.video_title = QLabel("Video Title: Not loaded")
             self.video_title.setFont(QFont('Segoe UI', 16, QFont.Bold))
@@ -257,7 +662,7 @@ class VideoDownloaderApp(QMainWindow):
             self.thumbnail_label.setFixedSize(320, 180)
             self.thumbnail_label.setAlignment(Qt.AlignCenter)
             self.thumbnail_label.setStyleSheet("border: 1px solid #dfe6e9; border-radius: 5px; background-color: #ffffff;")
-            self.loading_label = QLabel("Loading.")
+            self.loading_label = QLabel("Loading…")
             self.loading_label.setFont(QFont('Segoe UI', 12))
             self.loading_label.setAlignment(Qt.AlignCenter)
             self.loading_label.setVisible(False)
@@ -305,7 +710,7 @@ class VideoDownloaderApp(QMainWindow):
             self.update_ui_for_platform()
         except Exception as e:
             logging.error(f"UI initialization error: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Failed to initialize UI. Please restart the application.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Failed to initialize UI. Please restart the application.</span>")
 
     def update_ui_for_platform(self):
         try:
@@ -314,7 +719,7 @@ class VideoDownloaderApp(QMainWindow):
             self.video_list.setVisible(platform == "YouTube")
         except Exception as e:
             logging.error(f"Error updating UI for platform: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Error updating interface. Please try again.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Error updating interface. Please try again.</span>")
 
     def browse_folder(self):
         try:
@@ -323,52 +728,39 @@ class VideoDownloaderApp(QMainWindow):
                 self.output_input.setText(folder)
         except Exception as e:
             logging.error(f"Error browsing folder: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Failed to browse for folder. Please try again.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Failed to browse for folder. Please try again.</span>")
 
-    def clean_ansi_codes(self, text):
-        try:
-            ansi_regex = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            return ansi_regex.sub('', text)
-        except re.error as e:
-            logging.error(f"Error cleaning ANSI codes: {str(e)}")
-            return text
+    def log_status(self, message):
+        if not self._log_buf:
+            self._log_timer.start(250)
+        self._log_buf.append(message)
 
-    def update_loading_animation(self):
+    def _flush_log(self):
         try:
-            self.loading_index = (self.loading_index + 1) % len(self.loading_states)
-            self.loading_label.setText(self.loading_states[self.loading_index])
+            if self._log_buf:
+                self.status_log.append('<br>'.join(self._log_buf))
+                self._log_buf.clear()
         except Exception as e:
-            logging.error(f"Error updating loading animation: {str(e)}")
+            logging.error(f"Error flushing status log: {str(e)}")
 
     def is_not_found_error(self, error):
         try:
-            error_lower = str(error).lower()
-            return any(keyword in error_lower for keyword in [
-                "video unavailable", "not found", "content not available",
-                "video does not exist", "playlist does not exist", "removed",
-                "private video", "unavailable video", "not available",
-                "sign in", "login required"
-            ])
+            return bool(_NOT_FOUND_RE.search(str(error)))
         except Exception as e:
             logging.error(f"Error checking not found error: {str(e)}")
             return False
 
     def is_auth_required_error(self, error):
         try:
-            error_lower = str(error).lower()
-            return "sign in" in error_lower or "login required" in error_lower
+            return bool(_AUTH_RE.search(str(error)))
         except Exception as e:
             logging.error(f"Error checking auth required error: {str(e)}")
             return False
 
     def is_valid_url_for_platform(self, url, platform):
         try:
-            url_lower = url.lower()
-            if platform == "YouTube":
-                return "youtube.com" in url_lower or "youtu.be" in url_lower
-            elif platform == "Facebook":
-                return "facebook.com" in url_lower or "fb.watch" in url_lower
-            return False
+            platform_re = _PLATFORM_RE.get(platform)
+            return platform_re is not None and platform_re.match(url) is not None
         except Exception as e:
             logging.error(f"Error validating URL for platform: {str(e)}")
             return False
@@ -378,8 +770,16 @@ class VideoDownloaderApp(QMainWindow):
             if not info:
                 return None
             if 'thumbnails' in info and isinstance(info['thumbnails'], list) and info['thumbnails']:
-                thumbnails = sorted(info['thumbnails'], key=lambda x: x.get('height', 0), reverse=True)
-                return thumbnails[0].get('url')
+                thumbnails = [t for t in info['thumbnails'] if t.get('url')]
+                if thumbnails:
+                    # Prefer the smallest thumbnail that still fills the 320x180 preview
+                    candidates = [t for t in thumbnails
+                                  if (t.get('height') or 0) >= 180 or (t.get('width') or 0) >= 320]
+                    if candidates:
+                        best = min(candidates, key=lambda x: x.get('height') or 0)
+                    else:
+                        best = max(thumbnails, key=lambda x: x.get('height') or 0)
+                    return best['url']
             return info.get('thumbnail')
         except Exception as e:
             logging.error(f"Error getting best thumbnail: {str(e)}")
@@ -391,21 +791,21 @@ class VideoDownloaderApp(QMainWindow):
             platform = self.platform_combo.currentText()
 
             if not url:
-                self.status_log.append("<span style='color: #e74c3c;'>Error: Please enter a valid URL.</span>")
+                self.log_status("<span style='color: #e74c3c;'>Error: Please enter a valid URL.</span>")
                 return
 
             if not self.is_valid_url_for_platform(url, platform):
-                self.status_log.append("<span style='color: #e74c3c;'>Invalid URL for selected platform</span>")
+                self.log_status("<span style='color: #e74c3c;'>Invalid URL for selected platform</span>")
                 return
 
             self.video_info = []
             self.video_list.clear()
             self.download_button.setEnabled(False)
             self.thumbnail_label.setPixmap(QPixmap())
+            self.thumbnail_thread = None
             self.video_title.setText("Video Title: Loading...")
             self.loading_label.setVisible(True)
-            self.loading_timer.start(500)
-            self.status_log.append(f"Fetching info from {platform}...")
+            self.log_status(f"Fetching info from {platform}...")
 
             self.preview_thread = PreviewThread(url, platform)
             self.preview_thread.info_signal.connect(self.handle_preview_info)
@@ -413,9 +813,8 @@ class VideoDownloaderApp(QMainWindow):
             self.preview_thread.start()
         except Exception as e:
             logging.error(f"Error starting preview: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Failed to start preview. Please try again.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Failed to start preview. Please try again.</span>")
             self.loading_label.setVisible(False)
-            self.loading_timer.stop()
             self.video_title.setText("Video Title: Not loaded")
             self.download_button.setEnabled(False)
 
@@ -425,13 +824,19 @@ class VideoDownloaderApp(QMainWindow):
             self.video_info = []
             self.video_list.clear()
             self.loading_label.setVisible(False)
-            self.loading_timer.stop()
+            sender = self.sender()
+            if isinstance(sender, PreviewThread):
+                self.cache_info(sender.url, info)
 
             if platform == "YouTube" and 'entries' in info and info.get('_type') == 'playlist':
                 self.video_info = info['entries']
                 self.video_title.setText(f"Playlist: {info.get('title', 'Unknown Playlist')}")
-                for video in self.video_info:
-                    self.video_list.addItem(video.get('title', 'Unknown Title'))
+                # One model update for the whole playlist instead of one per entry
+                self.video_list.setUpdatesEnabled(False)
+                try:
+                    self.video_list.addItems([video.get('title', 'Unknown Title') for video in self.video_info])
+                finally:
+                    self.video_list.setUpdatesEnabled(True)
                 if self.video_info:
                     thumbnail_url = self.get_best_thumbnail(self.video_info[0])
                     self.display_thumbnail(thumbnail_url)
@@ -447,58 +852,91 @@ class VideoDownloaderApp(QMainWindow):
             self.download_button.setEnabled(True)
         except Exception as e:
             logging.error(f"Error handling preview info: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Failed to process preview data. Please try again.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Failed to process preview data. Please try again.</span>")
             self.loading_label.setVisible(False)
-            self.loading_timer.stop()
             self.video_title.setText("Video Title: Not loaded")
             self.download_button.setEnabled(False)
 
+    def cache_info(self, url, info):
+        self._info_cache[url] = info
+        self._info_cache.move_to_end(url)
+        while len(self._info_cache) > INFO_CACHE_SIZE:
+            self._info_cache.popitem(last=False)
+
+    def cached_download_infos(self, urls, entries):
+        # Only complete video results can be downloaded without re-running the extractor
+        infos = {}
+        for url, entry in zip(urls, entries):
+            if entry and entry.get('formats'):
+                infos[url] = entry
+        return infos
+
     def handle_preview_error(self, error):
         try:
             self.loading_label.setVisible(False)
-            self.loading_timer.stop()
             if self.is_not_found_error(error):
                 error_msg = "Video/Playlist not found with this URL"
                 if self.is_auth_required_error(error):
                     error_msg += ". For restricted videos, place a valid cookies.txt file in the application folder (C:\\Program Files\\VideoDownloader). See README.txt for instructions."
-                self.status_log.append(f"<span style='color: #e74c3c;'>{error_msg}</span>")
+                self.log_status(f"<span style='color: #e74c3c;'>{error_msg}</span>")
             else:
-                self.status_log.append("<span style='color: #e74c3c;'>An Error Occurred</span>")
+                self.log_status("<span style='color: #e74c3c;'>An Error Occurred</span>")
             self.video_title.setText("Video Title: Not loaded")
             self.download_button.setEnabled(False)
         except Exception as e:
             logging.error(f"Error handling preview error: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Failed to handle preview error. Please try again.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Failed to handle preview error. Please try again.</span>")
             self.video_title.setText("Video Title: Not loaded")
             self.download_button.setEnabled(False)
 
     def display_thumbnail(self, thumbnail_url):
         try:
             if thumbnail_url:
-                response = requests.get(thumbnail_url, timeout=5)
-                response.raise_for_status()
-                image = Image.open(BytesIO(response.content))
-                image = image.convert('RGB')
-                image = image.resize((320, 180), Image.LANCZOS)
-                qimage = QImage(image.tobytes(), image.size[0], image.size[1], QImage.Format_RGB888)
-                pixmap = QPixmap.fromImage(qimage)
-                self.thumbnail_label.setPixmap(pixmap)
+                thread = ThumbnailThread(thumbnail_url, self._http)
+                thread.image_signal.connect(self.set_thumbnail_image)
+                thread.error_signal.connect(self.handle_thumbnail_error)
+                # Keep a reference until the thread has fully stopped so it is not destroyed mid-run;
+                # finished threads are only pruned here, never from their own finished signal
+                self.thumbnail_threads = {t for t in self.thumbnail_threads if not t.isFinished()}
+                self.thumbnail_threads.add(thread)
+                self.thumbnail_thread = thread
+                thread.start()
             else:
                 logging.warning("No thumbnail URL provided")
                 self.thumbnail_label.setText("Thumbnail not available")
         except Exception as e:
             logging.error(f"Thumbnail error for URL {thumbnail_url}: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Failed to load thumbnail. Please try again.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Failed to load thumbnail. Please try again.</span>")
+            self.thumbnail_label.setText("Thumbnail not available")
+
+    def set_thumbnail_image(self, qimage):
+        try:
+            # Ignore results from an older preview that finished after a newer one started
+            if self.sender() is not self.thumbnail_thread:
+                return
+            self.thumbnail_label.setPixmap(QPixmap.fromImage(qimage))
+        except Exception as e:
+            logging.error(f"Error setting thumbnail: {str(e)}")
             self.thumbnail_label.setText("Thumbnail not available")
 
+    def handle_thumbnail_error(self, error):
+        try:
+            if self.sender() is not self.thumbnail_thread:
+                return
+            self.log_status("<span style='color: #e74c3c;'>Failed to load thumbnail. Please try again.</span>")
+            self.thumbnail_label.setText("Thumbnail not available")
+        except Exception as e:
+            logging.error(f"Error handling thumbnail error: {str(e)}")
+
     def toggle_select_all(self, state):
         try:
-            for i in range(self.video_list.count()):
-                item = self.video_list.item(i)
-                item.setSelected(state == Qt.Checked)
+            if state == Qt.Checked:
+                self.video_list.selectAll()
+            else:
+                self.video_list.clearSelection()
         except Exception as e:
             logging.error(f"Error toggling select all: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Failed to toggle video selection. Please try again.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Failed to toggle video selection. Please try again.</span>")
 
     def download_video(self):
         try:
@@ -507,92 +945,112 @@ class VideoDownloaderApp(QMainWindow):
             platform = self.platform_combo.currentText()
 
             if not url:
-                self.status_log.append("<span style='color: #e74c3c;'>Error: Please enter a valid URL.</span>")
+                self.log_status("<span style='color: #e74c3c;'>Error: Please enter a valid URL.</span>")
                 return
 
             if not self.is_valid_url_for_platform(url, platform):
-                self.status_log.append("<span style='color: #e74c3c;'>Invalid URL for selected platform</span>")
+                self.log_status("<span style='color: #e74c3c;'>Invalid URL for selected platform</span>")
                 return
 
-            if not os.path.exists(output_path):
-                try:
-                    os.makedirs(output_path)
-                except PermissionError as e:
-                    logging.error(f"Failed to create directory {output_path}: {str(e)}")
-                    output_path = tempfile.gettempdir()
-                    logging.warning(f"Falling back to temp directory: {output_path}")
-                    self.output_input.setText(output_path)
-                    self.status_log.append("<span style='color: #e7b416;'>Warning: Using temp directory due to permissions issue.</span>")
+            try:
+                os.makedirs(output_path, exist_ok=True)
+            except PermissionError as e:
+                logging.error(f"Failed to create directory {output_path}: {str(e)}")
+                output_path = tempfile.gettempdir()
+                logging.warning(f"Falling back to temp directory: {output_path}")
+                self.output_input.setText(output_path)
+                self.log_status("<span style='color: #e7b416;'>Warning: Using temp directory due to permissions issue.</span>")
 
             selected_videos = []
             is_playlist = platform == "YouTube" and len(self.video_info) > 1
             if is_playlist:
                 selected_items = self.video_list.selectedItems()
                 if not selected_items:
-                    self.status_log.append("<span style='color: #e74c3c;'>Error: Please select at least one video.</span>")
+                    self.log_status("<span style='color: #e74c3c;'>Error: Please select at least one video.</span>")
                     return
-                selected_videos = [self.video_info[self.video_list.row(item)]['url'] for item in selected_items]
+                selected_entries = [self.video_info[self.video_list.row(item)] for item in selected_items]
+                selected_videos = [entry['url'] for entry in selected_entries]
             else:
                 selected_videos = [url]
+                selected_entries = [self._info_cache.get(url)]
+            infos = self.cached_download_infos(selected_videos, selected_entries)
 
             self.download_button.setEnabled(False)
             self.progress_bar.setValue(0)
             self.last_percentage = -1
-            self.status_log.append(f"Starting download from {platform}...")
+            self.log_status(f"Starting download from {platform}...")
 
-            self.download_thread = DownloadThread(selected_videos, output_path, platform, is_playlist)
+            self.download_thread = DownloadThread(selected_videos, output_path, platform, is_playlist,
+                                                  max_workers=self.workers_spin.value(),
+                                                  fragment_workers=self.fragments_spin.value(),
+                                                  aria2c_path=self.aria2c_path if self.aria2c_check.isChecked() else None,
+                                                  infos=infos)
             self.download_thread.progress_signal.connect(self.progress_hook)
+            self.download_thread.postprocess_signal.connect(self.postprocess_started)
             self.download_thread.error_signal.connect(self.handle_error)
             self.download_thread.finished_signal.connect(self.download_finished)
             self.download_thread.start()
         except Exception as e:
             logging.error(f"Error starting download: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Failed to start download. Please try again.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Failed to start download. Please try again.</span>")
             self.download_button.setEnabled(True)
 
-    def progress_hook(self, d):
+    def progress_hook(self, status, percentage, speed):
         try:
-            if d['status'] == 'downloading':
-                percent_str = self.clean_ansi_codes(d.get('_percent_str', '0%')).replace('%', '').strip()
-                speed = self.clean_ansi_codes(d.get('_speed_str', 'Unknown speed')).replace('i', 'iB').strip()
-                try:
-                    percentage = float(percent_str)
-                    if percentage >= self.last_percentage + 0.1 or speed != "Unknown speed":
-                        self.progress_bar.setValue(int(percentage))
-                        self.status_log.append(f"Downloading: {percent_str}% at {speed}")
-                        self.last_percentage = percentage
-                except ValueError:
-                    self.status_log.append(f"Downloading: {percent_str}% at {speed} (Invalid percentage format)")
-            elif d['status'] == 'finished':
-                self.status_log.append("Download finished, processing file...")
+            if status == 'downloading':
+                if percentage < 0:
+                    self.log_status(f"Downloading at {speed} (Invalid percentage format)")
+                    return
+                # Rate limiting happens in DownloadThread before the signal crosses threads
+                if percentage >= self.last_percentage + 0.1 or speed != "Unknown speed":
+                    self.progress_bar.setValue(int(percentage))
+                    self.log_status(f"Downloading: {percentage:.1f}% at {speed}")
+                    self.last_percentage = percentage
+            elif status == 'finished':
+                self.log_status("Download finished, processing file...")
         except Exception as e:
             logging.error(f"Progress hook error: {str(e)}")
 
+    def postprocess_started(self, name):
+        try:
+            self.log_status(f"Processing file ({name})...")
+        except Exception as e:
+            logging.error(f"Error handling post-processing update: {str(e)}")
+
     def handle_error(self, error):
         try:
             if self.is_not_found_error(error):
                 error_msg = "Video/Playlist not found with this URL"
                 if self.is_auth_required_error(error):
                     error_msg += ". For restricted videos, place a valid cookies.txt file in the application folder (C:\\Program Files\\VideoDownloader). See README.txt for instructions."
-                self.status_log.append(f"<span style='color: #e74c3c;'>{error_msg}</span>")
+                self.log_status(f"<span style='color: #e74c3c;'>{error_msg}</span>")
             else:
-                self.status_log.append("<span style='color: #e74c3c;'>An Error Occurred</span>")
+                self.log_status("<span style='color: #e74c3c;'>An Error Occurred</span>")
             self.download_button.setEnabled(True)
         except Exception as e:
             logging.error(f"Error handling download error: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Failed to handle download error. Please try again.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Failed to handle download error. Please try again.</span>")
             self.download_button.setEnabled(True)
 
     def download_finished(self):
         try:
-            self.status_log.append("<span style='color: #2ecc71;'>Download complete!</span>")
+            self.log_status("<span style='color: #2ecc71;'>Download complete!</span>")
             self.download_button.setEnabled(True)
             self.progress_bar.setValue(100)
         except Exception as e:
             logging.error(f"Error handling download finished: {str(e)}")
-            self.status_log.append("<span style='color: #e74c3c;'>Failed to complete download process. Please try again.</span>")
+            self.log_status("<span style='color: #e74c3c;'>Failed to complete download process. Please try again.</span>")
             self.download_button.setEnabled(True)
 
+    def closeEvent(self, event):
+        try:
+            self._log_timer.stop()
+            self._http.close()
+            PreviewThread.close_shared_ydl()
+        except Exception as e:
+            logging.error(f"Error closing HTTP session: {str(e)}")
+        super().closeEvent(event)
+
 if __name__ == '__main__':
     try:
         app = QApplication(sys.argv)